@@ -16,20 +16,28 @@
 # - Meetup "startingSoon" cards sometimes have imperfect/variable timestamps.
 # - We use a best-effort time window but keep a fallback so the feed isn't empty.
 
+import functools
+import hashlib
+import heapq
+import io
 import os
 import re
 import json
 import html
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
 from zoneinfo import ZoneInfo
 
 from dateutil import parser as dateparser
+from selectolax.parser import HTMLParser
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
 MEETUP_URL = "https://www.meetup.com/find/?dateRange=startingSoon&source=EVENTS&eventType=online"
 
 OUT_DIR = "public"
 FEED_PATH = os.path.join(OUT_DIR, "feed.xml")
+FEED_HASH_PATH = os.path.join(OUT_DIR, ".feed.xml.sha")
 DEBUG_HTML = os.path.join(OUT_DIR, "debug.html")
 DEBUG_PNG = os.path.join(OUT_DIR, "debug.png")
 DEBUG_JSON = os.path.join(OUT_DIR, "debug.json")
@@ -40,6 +48,32 @@ LOCAL_TZ = ZoneInfo("America/Toronto")
 WINDOW_MINUTES = 90
 MAX_ITEMS = 50
 
+# Page weight we never need for scraping. Stylesheets stay: Meetup's
+# infinite scroll depends on layout, and debug.png should look like the page.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_URL_HINTS = ("analytics", "doubleclick", "googletagmanager", "hotjar", "facebook.")
+
+# Scroll progress is measured in event anchors, not scrollHeight — Meetup's
+# infinite scroll grows the page with skeleton placeholders too.
+ANCHOR_COUNT_JS = "document.querySelectorAll(\"a[href*='/events/']\").length"
+
+# Precompiled patterns (compiled once per process instead of per call)
+# One alternation covers "42 attendees"/"42 going", "Attendees: 42", and the
+# old bare-number fallback in a single pass over the text.
+ATTENDEE_COUNT_RE = re.compile(
+    r"\b(?P<n1>\d{1,6})\s*(?:attendees?|going|rsvps?|people|attending)\b"
+    r"|\battendees?\s*[:\-]?\s*(?P<n2>\d{1,6})\b"
+    r"|(?P<n3>\d{1,6})",
+    re.I,
+)
+REL_TIME_RE = re.compile(r"\bin\s+(\d{1,3})\s*(minute|hour)s?\b", re.I)
+TODAY_RE = re.compile(r"\btoday\b", re.I)
+TOMORROW_RE = re.compile(r"\btomorrow\b", re.I)
+# Cheap pre-filter: whenText that can plausibly land within the window.
+# Anything without one of these hints ("Tomorrow at 9pm", "Dec 15") cannot
+# be within the next hour, so we can skip date parsing entirely.
+SOON_HINT_RE = re.compile(r"starting soon|\bin\b|\bnow\b|\btoday\b|minute|\b1\s*hour\b", re.I)
+
 FEED_TITLE = "Meetup — Starting Within an Hour"
 FEED_LINK = MEETUP_URL
 FEED_DESCRIPTION = (
@@ -48,18 +82,56 @@ FEED_DESCRIPTION = (
 )
 
 
+# Characters html.escape would touch; most feed strings have none of them.
+_ESC_NEEDED_RE = re.compile(r"[<>&\"']")
+
+
+# Feed items repeat the same when_text/pubdate values ("Starting soon",
+# recurring series), so both helpers are worth memoizing.
+@functools.lru_cache(maxsize=256)
 def esc(s: str) -> str:
-    return html.escape((s or "").strip())
+    s = (s or "").strip()
+    if not _ESC_NEEDED_RE.search(s):
+        return s
+    return html.escape(s)
+
+
+# The channel header never changes within a process; escape it once.
+_ESC_FEED_TITLE = esc(FEED_TITLE)
+_ESC_FEED_LINK = esc(FEED_LINK)
+_ESC_FEED_DESCRIPTION = esc(FEED_DESCRIPTION)
 
 
 def now_local() -> datetime:
     return datetime.now(tz=LOCAL_TZ)
 
 
+# RFC 2822 wants English day/month names regardless of locale, so format
+# manually instead of going through strftime's locale tables.
+_RFC2822_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_RFC2822_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                   "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
 def rfc2822(dt: datetime) -> str:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    return dt.strftime("%a, %d %b %Y %H:%M:%S %z")
+    # Aware datetimes for the same instant compare (and hash) equal across
+    # timezones, so the cache key must carry the offset as well or a cached
+    # +0000 string could be returned for a -0400 datetime.
+    return _rfc2822(dt, int(dt.utcoffset().total_seconds() // 60))
+
+
+@functools.lru_cache(maxsize=256)
+def _rfc2822(dt: datetime, offset: int) -> str:
+    sign = "+" if offset >= 0 else "-"
+    offset = abs(offset)
+    return (
+        f"{_RFC2822_DAYS[dt.weekday()]}, {dt.day:02d} "
+        f"{_RFC2822_MONTHS[dt.month - 1]} {dt.year} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} "
+        f"{sign}{offset // 60:02d}{offset % 60:02d}"
+    )
 
 
 def attendees_to_int(attendees_text: str | None) -> int:
@@ -68,16 +140,23 @@ def attendees_to_int(attendees_text: str | None) -> int:
     """
     if not attendees_text:
         return 0
-    m = re.search(r"(\d{1,6})", attendees_text.replace(",", ""))
+    if "," in attendees_text:
+        attendees_text = attendees_text.replace(",", "")
+    m = ATTENDEE_COUNT_RE.search(attendees_text)
     if not m:
         return 0
     try:
-        return int(m.group(1))
+        return int(m.group("n1") or m.group("n2") or m.group("n3"))
     except Exception:
         return 0
 
 
-def parse_dt(dt_attr: str, when_text: str):
+# Memoizes parse_dt results; Meetup cards repeat identical dtAttr/whenText
+# strings (recurring series, "Starting soon"), so parse each unique pair once.
+_parse_cache: dict[tuple, datetime | None] = {}
+
+
+def parse_dt(dt_attr: str, when_text: str, base: datetime | None = None):
     """
     Parse event start time using:
       1) <time datetime="..."> attribute if present (best)
@@ -85,33 +164,53 @@ def parse_dt(dt_attr: str, when_text: str):
       3) "Today"/"Tomorrow" date strings
     Returns timezone-aware datetime in LOCAL_TZ or None.
     """
+    if base is None:
+        base = now_local()
+
+    # Relative strings resolve against `base`, so key on it at minute
+    # resolution to keep repeat lookups within one run cache hits.
+    key = (dt_attr, when_text, base.replace(second=0, microsecond=0))
+    if key in _parse_cache:
+        return _parse_cache[key]
+
+    result = _parse_dt_uncached(dt_attr, when_text, base)
+    _parse_cache[key] = result
+    return result
+
+
+def _parse_dt_uncached(dt_attr: str, when_text: str, base: datetime):
     if dt_attr:
+        # Meetup's <time datetime="..."> is ISO-8601; fromisoformat is far
+        # faster than dateutil's fuzzy parser, so try it first.
         try:
-            dt = dateparser.parse(dt_attr)
-            if dt:
-                return dt.astimezone(LOCAL_TZ) if dt.tzinfo else dt.replace(tzinfo=LOCAL_TZ)
-        except Exception:
-            pass
+            dt = datetime.fromisoformat(dt_attr.replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                dt = dateparser.parse(dt_attr)
+            except Exception:
+                dt = None
+        if dt:
+            return dt.astimezone(LOCAL_TZ) if dt.tzinfo else dt.replace(tzinfo=LOCAL_TZ)
 
     t = (when_text or "").strip()
     if not t:
         return None
 
-    base = now_local()
-    t = re.sub(r"\s+", " ", t)
+    # No whitespace collapsing needed: extract_cards already collapsed it
+    # when building when_text, and \s+/\b in the patterns are tolerant.
 
-    # Relative: "in 15 minutes", "in 1 hour"
-    rel = re.search(r"\bin\s+(\d{1,3})\s*(minute|minutes|hour|hours)\b", t, re.I)
+    # Relative: "in 15 minutes", "in 1 hour" — usually at the very start,
+    # so anchor with match() when possible instead of scanning.
+    rel = REL_TIME_RE.match(t) if t[:3].lower() == "in " else REL_TIME_RE.search(t)
     if rel:
         n = int(rel.group(1))
-        unit = rel.group(2).lower()
-        return base + (timedelta(hours=n) if "hour" in unit else timedelta(minutes=n))
+        return base + (timedelta(hours=n) if rel.group(2)[0].lower() == "h" else timedelta(minutes=n))
 
     # Today/Tomorrow normalization
-    if re.search(r"\btoday\b", t, re.I):
-        t = re.sub(r"\btoday\b", base.strftime("%Y-%m-%d"), t, flags=re.I)
-    if re.search(r"\btomorrow\b", t, re.I):
-        t = re.sub(r"\btomorrow\b", (base + timedelta(days=1)).strftime("%Y-%m-%d"), t, flags=re.I)
+    if TODAY_RE.search(t):
+        t = TODAY_RE.sub(base.strftime("%Y-%m-%d"), t)
+    if TOMORROW_RE.search(t):
+        t = TOMORROW_RE.sub((base + timedelta(days=1)).strftime("%Y-%m-%d"), t)
 
     try:
         dt = dateparser.parse(t)
@@ -122,7 +221,7 @@ def parse_dt(dt_attr: str, when_text: str):
         return None
 
 
-def within_window(dt: datetime | None, when_text: str) -> bool:
+def within_window(dt: datetime | None, when_text: str, now: datetime | None = None) -> bool:
     """
     Keep if:
       - dt exists and within WINDOW_MINUTES
@@ -131,7 +230,7 @@ def within_window(dt: datetime | None, when_text: str) -> bool:
       - OR fallback keep (because the page itself is "startingSoon")
     """
     if dt:
-        start = now_local()
+        start = now if now is not None else now_local()
         end = start + timedelta(minutes=WINDOW_MINUTES)
         return start <= dt <= end
 
@@ -139,67 +238,194 @@ def within_window(dt: datetime | None, when_text: str) -> bool:
     if "starting soon" in t:
         return True
 
-    m = re.search(r"\bin\s+(\d{1,3})\s*(minute|minutes|hour|hours)\b", t)
+    m = REL_TIME_RE.match(t) if t.startswith("in ") else REL_TIME_RE.search(t)
     if m:
         n = int(m.group(1))
-        unit = m.group(2)
-        minutes = n * 60 if "hour" in unit else n
+        minutes = n * 60 if m.group(2)[0] == "h" else n
         return minutes <= WINDOW_MINUTES
 
     # fallback: keep
     return True
 
 
+@dataclass(slots=True)
+class FeedItem:
+    title: str
+    url: str
+    when_text: str
+    attendees_text: str
+    attendees_count: int
+    pubdate: str
+
+
 def build_rss(items):
     last_build = rfc2822(datetime.now(timezone.utc))
 
-    rss_items = []
-    for it in items:
-        title = esc(it.get("title", ""))
-        link = esc(it.get("url", ""))
-        when_text = esc(it.get("when_text", ""))
-        attendees_text = esc(it.get("attendees_text", ""))
-
-        desc_parts = []
-        if when_text:
-            desc_parts.append(f"<p><b>Time:</b> {when_text}</p>")
-        if attendees_text:
-            desc_parts.append(f"<p><b>Attendees:</b> {attendees_text}</p>")
-        desc_parts.append(f"<p><a href=\"{link}\">Open event</a></p>")
+    buf = io.StringIO()
+    buf.write(f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+<channel>
+  <title>{_ESC_FEED_TITLE}</title>
+  <link>{_ESC_FEED_LINK}</link>
+  <description>{_ESC_FEED_DESCRIPTION}</description>
+  <lastBuildDate>{last_build}</lastBuildDate>
+  <ttl>60</ttl>
+""")
 
-        pubdate = it.get("pubdate", last_build)
+    for it in items:
+        title = esc(it.title)
+        link = esc(it.url)
+        when_text = esc(it.when_text)
+        attendees_text = esc(it.attendees_text)
+        pubdate = it.pubdate or last_build
 
-        rss_items.append(f"""<item>
+        buf.write(f"""<item>
   <title>{title}</title>
   <link>{link}</link>
   <guid isPermaLink="true">{link}</guid>
   <pubDate>{pubdate}</pubDate>
-  <description><![CDATA[{''.join(desc_parts)}]]></description>
-</item>""")
+  <description><![CDATA[""")
+        if when_text:
+            buf.write(f"<p><b>Time:</b> {when_text}</p>")
+        if attendees_text:
+            buf.write(f"<p><b>Attendees:</b> {attendees_text}</p>")
+        buf.write(f"<p><a href=\"{link}\">Open event</a></p>")
+        buf.write("]]></description>\n</item>\n")
+
+    buf.write("</channel>\n</rss>\n")
+    return buf.getvalue()
 
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-<channel>
-  <title>{esc(FEED_TITLE)}</title>
-  <link>{esc(FEED_LINK)}</link>
-  <description>{esc(FEED_DESCRIPTION)}</description>
-  <lastBuildDate>{last_build}</lastBuildDate>
-  <ttl>60</ttl>
-{chr(10).join(rss_items)}
-</channel>
-</rss>
-"""
+
+def feed_digest(rss: str) -> str:
+    """
+    Content hash of the feed, excluding lastBuildDate (which changes every
+    run) so only real item changes invalidate it.
+    """
+    stable = "\n".join(l for l in rss.splitlines() if "<lastBuildDate>" not in l)
+    return hashlib.blake2b(stable.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _closest_card(anchor):
+    """
+    Python equivalent of the old JS a.closest(...) chain: prefer the
+    data-testid event card, then the nearest article/li/div ancestor.
+    """
+    fallbacks = {}
+    cur = anchor.parent
+    while cur is not None:
+        if (cur.attributes or {}).get("data-testid") == "categoryResults-eventCard":
+            return cur
+        if cur.tag in ("article", "li", "div") and cur.tag not in fallbacks:
+            fallbacks[cur.tag] = cur
+        cur = cur.parent
+    return fallbacks.get("article") or fallbacks.get("li") or fallbacks.get("div")
+
+
+def extract_cards(page_html: str, page_url: str):
+    """
+    Extract event cards from the rendered HTML with selectolax (C-backed).
+    One content() snapshot + local parse replaces the per-anchor work the
+    old evaluate() script did inside the browser and the CDP serialization
+    of the result.
+    """
+    tree = HTMLParser(page_html)
+
+    out = []
+    seen = set()
+    anchors = tree.css("a[href*='/events/']")
+
+    for a in anchors:
+        # Cards are DOM-ordered soonest-first and the feed is capped at
+        # MAX_ITEMS; overfetch a little to survive the window filter.
+        if len(out) >= MAX_ITEMS + 10:
+            break
+        href = (a.attributes.get("href") or "").strip()
+        if not href:
+            continue
+        url = urljoin(page_url or MEETUP_URL, href)
+        # Canonicalize: the same event appears under ?eventOrigin=... and
+        # fragment variants; keep only the first occurrence of the path.
+        url = url.split("#", 1)[0].split("?", 1)[0]
+        if url in seen:
+            continue
+        seen.add(url)
+
+        card = _closest_card(a)
+
+        # Title
+        title = ""
+        if card is not None:
+            h3 = card.css_first("h3")
+            if h3 is not None:
+                title = h3.text(deep=True, separator=" ")
+        if not title.strip():
+            title = a.attributes.get("aria-label") or a.text(deep=True, separator=" ")
+        # Collapse whitespace like innerText would; Node.text() keeps
+        # newlines and indentation from wrapped markup.
+        title = " ".join((title or "").split())
+        if not title or len(title) < 3:
+            continue
+
+        # Time
+        when_text = ""
+        dt_attr = ""
+        if card is not None:
+            time_el = card.css_first("time")
+            if time_el is not None:
+                when_text = " ".join(time_el.text(deep=True, separator=" ").split())
+                dt_attr = (time_el.attributes.get("datetime") or "").strip()
+
+        # Attendees (scan for a span containing "attendee")
+        attendees_text = ""
+        if card is not None:
+            for s in card.css("span"):
+                t = " ".join(s.text(deep=True, separator=" ").split())
+                if "attendee" in t.lower():
+                    attendees_text = t
+                    break
+
+        out.append({
+            "title": title,
+            "url": url,
+            "whenText": when_text,
+            "dtAttr": dt_attr,
+            "attendeesText": attendees_text,
+            "attendees": attendees_to_int(attendees_text),
+        })
+
+    title_el = tree.css_first("title")
+    page_title = title_el.text(deep=True) if title_el is not None else ""
+    # Drop script/style/noscript before building the snippet: their text is
+    # not visible, and a hydration blob or "enable JavaScript" banner would
+    # otherwise trip the blocked-page signals in main().
+    tree.strip_tags(["script", "style", "noscript"])
+    body = tree.body
+    return {
+        "pageTitle": page_title,
+        "url": page_url,
+        "countAnchors": len(anchors),
+        "extracted": len(out),
+        "bodySnippet": body.text(deep=True, separator="\n")[:800] if body is not None else "",
+        "events": out,
+    }
 
 
 def scrape_rendered_dom():
     """
-    Render the lazy Meetup page on the runner and extract event cards via evaluate().
+    Render the lazy Meetup page on the runner, snapshot its HTML, and parse
+    the cards locally with selectolax.
     Also writes debug.html/debug.png/debug.json so you can inspect what loaded.
     """
     with sync_playwright() as p:
+        # Single-shot process on a cron runner, so a warm browser pool isn't
+        # an option; trim Chromium's cold start instead.
         browser = p.chromium.launch(
             headless=True,
-            args=["--disable-blink-features=AutomationControlled"],
+            args=[
+                "--disable-blink-features=AutomationControlled",
+                "--disable-dev-shm-usage",
+                "--no-zygote",
+            ],
         )
 
         context = browser.new_context(
@@ -215,38 +441,64 @@ def scrape_rendered_dom():
 
         page = context.new_page()
 
+        def _route_filter(route):
+            req = route.request
+            if req.resource_type in BLOCKED_RESOURCE_TYPES or any(
+                h in req.url for h in BLOCKED_URL_HINTS
+            ):
+                route.abort()
+            else:
+                route.continue_()
+
+        page.route("**/*", _route_filter)
+
         try:
             page.goto(MEETUP_URL, wait_until="domcontentloaded", timeout=120000)
         except PlaywrightTimeoutError:
             pass
 
-        # Allow React to hydrate
-        page.wait_for_timeout(6000)
+        # Allow React to hydrate (shorter now that images/fonts are blocked)
+        page.wait_for_timeout(4000)
 
-        # Scroll to load more cards
-        prev_height = 0
+        # Scroll to load more cards; stop once we have enough anchors for the
+        # feed cap or no new ones are appearing.
+        prev_count = 0
         stable = 0
         for _ in range(25):
             page.mouse.wheel(0, 3000)
-            page.wait_for_timeout(1200)
+            # Wait only until new content actually lands instead of a fixed
+            # 1.2s sleep; the timeout is the worst case, not the common one.
             try:
-                h = page.evaluate("document.body.scrollHeight")
+                page.wait_for_function(
+                    f"n => {ANCHOR_COUNT_JS} > n",
+                    arg=prev_count,
+                    timeout=1500,
+                )
             except Exception:
-                h = prev_height
-            if h == prev_height:
+                pass
+            try:
+                count = page.evaluate(ANCHOR_COUNT_JS)
+            except Exception:
+                count = prev_count
+            if count == prev_count:
                 stable += 1
             else:
                 stable = 0
-                prev_height = h
-            if stable >= 5:
+                prev_count = count
+            if count >= MAX_ITEMS or stable >= 2:
                 break
 
         os.makedirs(OUT_DIR, exist_ok=True)
 
+        # Snapshot the DOM once, then let the browser go — everything after
+        # this is local string work.
+        html_snapshot = page.content()
+        page_url = page.url
+
         # Debug artifacts
         try:
             with open(DEBUG_HTML, "w", encoding="utf-8") as f:
-                f.write(page.content())
+                f.write(html_snapshot)
         except Exception:
             pass
 
@@ -255,79 +507,17 @@ def scrape_rendered_dom():
         except Exception:
             pass
 
-        raw = page.evaluate(
-            """
-            () => {
-              const anchors = Array.from(document.querySelectorAll("a[href*='/events/']"));
-              const out = [];
-              const seen = new Set();
-
-              function absUrl(href) {
-                try { return new URL(href, location.origin).toString(); }
-                catch(e) { return href || ""; }
-              }
-
-              for (const a of anchors) {
-                const url = absUrl(a.getAttribute("href") || a.href || "");
-                if (!url || seen.has(url)) continue;
-                seen.add(url);
-
-                const card =
-                  a.closest("[data-testid='categoryResults-eventCard']") ||
-                  a.closest("article") ||
-                  a.closest("li") ||
-                  a.closest("div");
-
-                // Title
-                let title =
-                  card?.querySelector("h3")?.innerText ||
-                  a.getAttribute("aria-label") ||
-                  a.innerText ||
-                  "";
-                title = (title || "").trim();
-                if (!title || title.length < 3) continue;
-
-                // Time
-                const timeEl = card?.querySelector("time");
-                const whenText = (timeEl?.innerText || "").trim();
-                const dtAttr = (timeEl?.getAttribute("datetime") || "").trim();
-
-                // Attendees (scan for a span containing "attendee")
-                let attendeesText = "";
-                const spans = card?.querySelectorAll("span") || [];
-                for (const s of spans) {
-                  const t = (s.innerText || "").trim();
-                  if (t.toLowerCase().includes("attendee")) {
-                    attendeesText = t;
-                    break;
-                  }
-                }
-
-                const cardText = (card && card.innerText) ? card.innerText : (a.innerText || "");
-
-                out.push({ title, url, whenText, dtAttr, attendeesText, cardText });
-              }
-
-              return {
-                pageTitle: document.title,
-                url: location.href,
-                countAnchors: anchors.length,
-                extracted: out.length,
-                bodySnippet: (document.body && document.body.innerText) ? document.body.innerText.slice(0, 800) : "",
-                events: out
-              };
-            }
-            """
-        )
+        browser.close()
 
-        try:
-            with open(DEBUG_JSON, "w", encoding="utf-8") as f:
-                json.dump(raw, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+    raw = extract_cards(html_snapshot, page_url)
 
-        browser.close()
-        return raw
+    try:
+        with open(DEBUG_JSON, "w", encoding="utf-8") as f:
+            json.dump(raw, f, ensure_ascii=False, indent=2)
+    except Exception:
+        pass
+
+    return raw
 
 
 def main():
@@ -343,32 +533,40 @@ def main():
     blocked_signals = ["verify", "captcha", "robot", "unusual traffic", "enable javascript"]
     is_blocked = (count_anchors == 0 and extracted == 0) or any(s in body_snip for s in blocked_signals)
 
+    now = now_local()
+    now_pub = rfc2822(now.astimezone(timezone.utc))
     items = []
 
     if is_blocked:
-        items.append({
-            "title": "⚠️ Meetup blocked or page did not render on GitHub runner",
-            "url": MEETUP_URL,
-            "when_text": f"anchors={count_anchors}, extracted={extracted}. Open /debug.png and /debug.html on GitHub Pages.",
-            "attendees_text": "",
-            "attendees_count": 0,
-            "pubdate": rfc2822(datetime.now(timezone.utc)),
-        })
+        items.append(FeedItem(
+            title="⚠️ Meetup blocked or page did not render on GitHub runner",
+            url=MEETUP_URL,
+            when_text=f"anchors={count_anchors}, extracted={extracted}. Open /debug.png and /debug.html on GitHub Pages.",
+            attendees_text="",
+            attendees_count=0,
+            pubdate=now_pub,
+        ))
     else:
         for e in events:
-            base_title = (e.get("title") or "").strip()
-            url = (e.get("url") or "").strip()
-            when_text = (e.get("whenText") or "").strip()
-            dt_attr = (e.get("dtAttr") or "").strip()
-            attendees_text = (e.get("attendeesText") or "").strip()
+            # extract_cards guarantees these keys and already trims them
+            base_title = e["title"]
+            url = e["url"]
+            when_text = e["whenText"]
+            dt_attr = e["dtAttr"]
+            attendees_text = e["attendeesText"]
+
+            # No datetime attribute and whenText clearly points beyond the
+            # window ("Tomorrow at 9pm", "Dec 15"): drop without parsing.
+            if not dt_attr and when_text and not SOON_HINT_RE.search(when_text):
+                continue
 
-            start_dt = parse_dt(dt_attr, when_text)
+            start_dt = parse_dt(dt_attr, when_text, base=now)
 
             # Keep events in (best-effort) time window
-            if not within_window(start_dt, when_text):
+            if not within_window(start_dt, when_text, now=now):
                 continue
 
-            attendees_count = attendees_to_int(attendees_text)
+            attendees_count = e["attendees"]
 
             # Build title: Title | Date/Time | Attendees
             title_parts = [base_title]
@@ -378,43 +576,64 @@ def main():
                 title_parts.append(attendees_text)
             title = " | ".join(title_parts)
 
-            pub = rfc2822(start_dt.astimezone(timezone.utc)) if start_dt else rfc2822(datetime.now(timezone.utc))
-
-            items.append({
-                "title": title,
-                "url": url,
-                "when_text": when_text if when_text else "Starting soon (time not provided on card)",
-                "attendees_text": attendees_text,
-                "attendees_count": attendees_count,
-                "pubdate": pub,
-            })
+            pub = rfc2822(start_dt.astimezone(timezone.utc)) if start_dt else now_pub
 
-        # ✅ Sort by attendees DESC (most attendees first)
-        items.sort(key=lambda x: x.get("attendees_count", 0), reverse=True)
+            items.append(FeedItem(
+                title=title,
+                url=url,
+                when_text=when_text if when_text else "Starting soon (time not provided on card)",
+                attendees_text=attendees_text,
+                attendees_count=attendees_count,
+                pubdate=pub,
+            ))
 
-        items = items[:MAX_ITEMS]
+        # ✅ Most attendees FIRST. The window filter has already run, so just
+        # select the top MAX_ITEMS instead of fully sorting and slicing;
+        # nlargest keeps the same order sorted(reverse=True) would.
+        items = heapq.nlargest(MAX_ITEMS, items, key=lambda x: x.attendees_count)
 
         if not items:
-            items.append({
-                "title": "ℹ️ Events were extracted but time filtering kept 0",
-                "url": MEETUP_URL,
-                "when_text": f"anchors={count_anchors}, extracted={extracted}, kept=0. Check /debug.json for whenText/dtAttr.",
-                "attendees_text": "",
-                "attendees_count": 0,
-                "pubdate": rfc2822(datetime.now(timezone.utc)),
-            })
+            items.append(FeedItem(
+                title="ℹ️ Events were extracted but time filtering kept 0",
+                url=MEETUP_URL,
+                when_text=f"anchors={count_anchors}, extracted={extracted}, kept=0. Check /debug.json for whenText/dtAttr.",
+                attendees_text="",
+                attendees_count=0,
+                pubdate=now_pub,
+            ))
 
     rss = build_rss(items)
-    with open(FEED_PATH, "w", encoding="utf-8") as f:
-        f.write(rss)
+    digest = feed_digest(rss)
+    prev_digest = ""
+    try:
+        with open(FEED_HASH_PATH, "r", encoding="utf-8") as f:
+            prev_digest = f.read().strip()
+    except OSError:
+        pass
+
+    unchanged = digest == prev_digest and os.path.exists(FEED_PATH)
+    if not unchanged:
+        with open(FEED_PATH, "w", encoding="utf-8") as f:
+            f.write(rss)
+        with open(FEED_HASH_PATH, "w", encoding="utf-8") as f:
+            f.write(digest)
+
+    # Tell the workflow whether the gh-pages deploy can be skipped
+    gh_output = os.environ.get("GITHUB_OUTPUT")
+    if gh_output:
+        with open(gh_output, "a", encoding="utf-8") as f:
+            f.write(f"changed={'false' if unchanged else 'true'}\n")
 
     # Logs in GitHub Actions
     print(f"[INFO] pageTitle={raw.get('pageTitle')}")
     print(f"[INFO] anchors={count_anchors}, extracted={extracted}, rss_items={len(items)}")
-    if items and "attendees_count" in items[0]:
+    if items:
         top = items[0]
-        print(f"[INFO] top_item_attendees={top.get('attendees_count')} title={top.get('title')[:120]}")
-    print(f"[INFO] wrote: {FEED_PATH}")
+        print(f"[INFO] top_item_attendees={top.attendees_count} title={top.title[:120]}")
+    if unchanged:
+        print(f"[INFO] unchanged, skipped write: {FEED_PATH}")
+    else:
+        print(f"[INFO] wrote: {FEED_PATH}")
     print(f"[INFO] debug: {DEBUG_HTML}, {DEBUG_PNG}, {DEBUG_JSON}")
 
 